@@ -22,12 +22,40 @@ actions.
 """
 from __future__ import annotations
 
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache
 import re
-from typing import Dict, Iterable, List, Pattern, Sequence, Tuple
+from typing import Dict, Iterable, Iterator, List, Pattern, Sequence, Set, Tuple
 
+try:  # Optional C-accelerated multi-pattern matcher.
+    import ahocorasick
+except ImportError:  # pragma: no cover - exercised only without pyahocorasick
+    ahocorasick = None
 
-@dataclass(frozen=True)
+
+class Risk(IntEnum):
+    """Ordered risk levels used by the review internals.
+
+    Risk is carried as an integer during computation; the public names
+    ("low", "medium", "high") are produced only at the output boundary.
+    """
+
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+
+
+_RISK_NAMES = ("low", "medium", "high")
+_RISK_BY_NAME = {"low": Risk.LOW, "medium": Risk.MEDIUM, "high": Risk.HIGH}
+
+_POSITIVE_PREFIX = "양호: "
+_POSITIVE_SUFFIX = " 표현이 있어 조건이 개선됩니다."
+
+
+@dataclass(frozen=True, slots=True)
 class ClauseConfig:
     """Configuration describing how to evaluate a contract clause."""
 
@@ -40,13 +68,27 @@ class ClauseConfig:
     positive_keywords: Sequence[str] = field(default_factory=tuple)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class _CompiledClause:
+    """A clause configuration paired with its precompiled patterns."""
+
+    config: ClauseConfig
+    keywords: Tuple[str, ...]
+    warning_re: Pattern[str]
+    positive_re: Pattern[str]
+    warning_prefixes: Tuple[str, ...]
+    positive_prefixes: Tuple[str, ...]
+    has_warnings: bool
+    has_positives: bool
+
+
+@dataclass(slots=True)
 class ClauseResult:
     """Outcome of analysing a clause within the contract."""
 
     name: str
     present: bool
-    risk_level: str
+    risk_level: Risk
     matched_sentences: List[str]
     issues: List[str]
     notes: List[str]
@@ -54,20 +96,40 @@ class ClauseResult:
     summary: str
 
     def to_dict(self) -> Dict[str, object]:
-        """Return a JSON-serialisable representation of the result."""
+        """Return a JSON-serialisable representation of the result.
+
+        The list values are views of the result's own lists rather than
+        copies; callers that want to mutate them should copy first.
+        """
 
         return {
             "name": self.name,
             "present": self.present,
-            "risk_level": self.risk_level,
-            "matched_sentences": list(self.matched_sentences),
-            "issues": list(self.issues),
-            "notes": list(self.notes),
+            "risk_level": _RISK_NAMES[self.risk_level],
+            "matched_sentences": self.matched_sentences,
+            "issues": self.issues,
+            "notes": self.notes,
             "recommendation": self.recommendation,
             "summary": self.summary,
         }
 
 
+@dataclass(slots=True)
+class ReviewResult:
+    """Structured outcome of reviewing a whole contract."""
+
+    overall_risk: Risk
+    clauses: List[ClauseResult]
+
+    def to_json_dict(self) -> Dict[str, object]:
+        """Return a JSON-serialisable representation of the review."""
+
+        return {
+            "overall_risk": _RISK_NAMES[self.overall_risk],
+            "clauses": [clause.to_dict() for clause in self.clauses],
+        }
+
+
 class ContractReviewService:
     """A lightweight AI-style contract review service.
 
@@ -80,6 +142,137 @@ class ContractReviewService:
         self._clauses: List[ClauseConfig] = list(
             clause_configs if clause_configs is not None else self._default_configs()
         )
+        self._first_chars = frozenset(
+            keyword.strip().lower()[:1]
+            for config in self._clauses
+            for keyword in (
+                *config.keywords,
+                *config.warning_keywords,
+                *config.positive_keywords,
+            )
+            if keyword.strip()
+        )
+        if ahocorasick is not None:
+            self._automaton = self._build_automaton(self._clauses)
+            self._compiled: List[_CompiledClause] | None = None
+        else:
+            self._automaton = None
+            self._compiled = [
+                _CompiledClause(
+                    config,
+                    tuple(
+                        " ".join(keyword.strip().lower().split())
+                        for keyword in config.keywords
+                        if keyword.strip()
+                    ),
+                    self._compile_literal_re(config.warning_keywords),
+                    self._compile_literal_re(config.positive_keywords),
+                    self._proper_prefix_keywords(config.warning_keywords),
+                    self._proper_prefix_keywords(config.positive_keywords),
+                    bool(config.warning_keywords),
+                    bool(config.positive_keywords),
+                )
+                for config in self._clauses
+            ]
+            self._candidate_res = [
+                self._compile_candidate_re(config.keywords) for config in self._clauses
+            ]
+            self._scan_all = self._build_scan_all()
+        self._review_cached = lru_cache(maxsize=256)(self._review_uncached)
+
+    def _build_scan_all(self):
+        """Generate a scanner specialised for the configured clauses.
+
+        The clause and keyword loops of the fallback scan are unrolled into
+        generated source with the keyword literals inlined, compiled once per
+        service. Only the literal checks remain in the per-sentence bytecode.
+        Keywords without word characters compile to plain substring checks,
+        mirroring the unanchored branch of :meth:`_keyword_fragment`.
+        """
+
+        lines = [
+            "def _scan_all(sentences, candidates):",
+            "    matched = [%s]" % ", ".join("[]" for _ in self._compiled),
+        ]
+        for clause_idx in range(len(self._compiled)):
+            lines.append("    append_%d = matched[%d].append" % (clause_idx, clause_idx))
+            lines.append("    want_%d = %d in candidates" % (clause_idx, clause_idx))
+        lines.append("    for sentence in sentences:")
+        lines.append("        if _first_chars.isdisjoint(sentence):")
+        lines.append("            continue")
+        for clause_idx, compiled in enumerate(self._compiled):
+            if not compiled.keywords:
+                continue
+            checks = " or ".join(
+                "_has_keyword(sentence, %r)" % keyword
+                if self._WORD_RE.search(keyword)
+                else "%r in sentence" % keyword
+                for keyword in compiled.keywords
+            )
+            lines.append("        if want_%d and (%s):" % (clause_idx, checks))
+            lines.append("            append_%d(sentence)" % clause_idx)
+        lines.append("    return matched")
+
+        namespace = {
+            "_has_keyword": self._has_keyword,
+            "_first_chars": self._first_chars,
+        }
+        exec(compile("\n".join(lines), "<generated clause scan>", "exec"), namespace)
+        return namespace["_scan_all"]
+
+    @classmethod
+    def _compile_candidate_re(cls, keywords: Sequence[str]) -> Pattern[str]:
+        """Compile one clause's keywords into a document-level quick check.
+
+        A single ``search`` over the raw contract text tells whether the
+        clause has at least one keyword hit anywhere. Each clause keeps its
+        own pattern, so keywords shared or overlapping between clauses cannot
+        shadow one another. The pattern is case-insensitive because it runs
+        before normalisation.
+        """
+
+        fragments = [
+            fragment
+            for fragment in (cls._keyword_fragment(keyword) for keyword in keywords)
+            if fragment is not None
+        ]
+        if not fragments:
+            return re.compile(r"(?!)")
+        return re.compile("|".join(fragments), re.IGNORECASE)
+
+    @staticmethod
+    def _build_automaton(clauses: Sequence[ClauseConfig]):
+        """Aggregate every configured phrase into one Aho-Corasick automaton.
+
+        Each phrase maps to the list of ``(clause_idx, kind, keyword)`` owners
+        that reference it, so a single pass over a sentence yields all keyword,
+        warning and positive hits for every clause at once. Clause keywords
+        are normalised like the fallback's pattern fragments; warning and
+        positive phrases are inserted verbatim because they match as
+        case-sensitive substrings of the normalised text on every path.
+        """
+
+        automaton = ahocorasick.Automaton()
+        entries: Dict[str, List[Tuple[int, str, str]]] = {}
+        word_re = ContractReviewService._WORD_RE
+        for clause_idx, config in enumerate(clauses):
+            for kind, keywords in (
+                ("keyword", config.keywords),
+                ("warning", config.warning_keywords),
+                ("positive", config.positive_keywords),
+            ):
+                for keyword in keywords:
+                    if kind == "keyword":
+                        phrase = " ".join(keyword.strip().lower().split())
+                    else:
+                        phrase = keyword
+                    if phrase:
+                        entries.setdefault(phrase, []).append((clause_idx, kind, keyword))
+        for phrase, owners in entries.items():
+            needs_boundary = word_re.search(phrase) is not None
+            automaton.add_word(phrase, (phrase, needs_boundary, owners))
+        automaton.make_automaton()
+        return automaton
 
     @staticmethod
     def _default_configs() -> List[ClauseConfig]:
@@ -142,108 +335,351 @@ class ContractReviewService:
             ),
         ]
 
-    def review(self, contract_text: str) -> Dict[str, object]:
-        """Analyse the contract text and return a structured report."""
+    def review(self, contract_text: str) -> ReviewResult:
+        """Analyse the contract text and return a structured report.
 
-        normalised = self._normalise_text(contract_text)
-        sentences = self._split_sentences(normalised)
-        clause_results = [self._evaluate_clause(clause, sentences) for clause in self._clauses]
+        Results are memoised per service instance, so resubmitting an
+        identical contract (a common case with templated agreements) returns
+        the cached :class:`ReviewResult` without rescanning. Callers must
+        treat the returned result as read-only.
+        """
+
+        return self._review_cached(contract_text)
+
+    def _review_uncached(self, contract_text: str) -> ReviewResult:
+        sentences = list(self._iter_sentences(contract_text))
+        if self._automaton is not None:
+            clause_results = self._scan_with_automaton(sentences)
+        else:
+            clause_results = self._scan_fallback(contract_text, sentences)
         overall_risk = self._calculate_overall_risk(clause_results)
 
-        return {
-            "overall_risk": overall_risk,
-            "clauses": [result.to_dict() for result in clause_results],
-        }
+        return ReviewResult(overall_risk=overall_risk, clauses=clause_results)
 
-    def generate_report(self, review_result: Dict[str, object]) -> str:
-        """Format the structured review result as a readable report."""
+    def review_many(
+        self,
+        contract_texts: Iterable[str],
+        workers: int | None = None,
+    ) -> List[ReviewResult]:
+        """Review several contracts in parallel worker processes.
 
-        lines = [
+        The service itself is stateless after construction, so each worker
+        rebuilds the compiled matcher once from the clause configurations and
+        then reviews its share of the batch. Small batches (or ``workers=1``)
+        are reviewed in-process to avoid the pool start-up cost.
+        """
+
+        texts = list(contract_texts)
+        if len(texts) <= 1 or (workers is not None and workers <= 1):
+            return [self.review(text) for text in texts]
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._clauses,),
+        ) as executor:
+            return list(executor.map(_worker_review, texts, chunksize=16))
+
+    def generate_report(self, review_result: ReviewResult | Dict[str, object]) -> str:
+        """Format the structured review result as a readable report.
+
+        Accepts either a :class:`ReviewResult` or, for backwards
+        compatibility, the dict shape previously returned by :meth:`review`.
+        """
+
+        if isinstance(review_result, dict):
+            review_result = self._review_result_from_dict(review_result)
+
+        parts = [
             "AI 기반 계약서 분석 보고서",
             "============================",
-            f"전체 위험도: {review_result['overall_risk'].upper()}",
+            "전체 위험도: %s" % _RISK_NAMES[review_result.overall_risk].upper(),
             "",
         ]
 
-        clauses = review_result.get("clauses", [])
-        for clause in clauses:
-            lines.extend(
-                [
-                    f"[{clause['name']} - 위험도: {clause['risk_level']}]",
-                    clause.get("summary", ""),
-                ]
-            )
-            matches = clause.get("matched_sentences") or []
-            if matches:
-                lines.append("  감지된 문장:")
-                for sentence in matches:
-                    lines.append(f"    - {sentence}")
-            issues = clause.get("issues") or []
-            if issues:
-                lines.append("  이슈:")
-                for issue in issues:
-                    lines.append(f"    - {issue}")
-            notes = clause.get("notes") or []
-            if notes:
-                lines.append("  참고:")
-                for note in notes:
-                    lines.append(f"    - {note}")
-            recommendation = clause.get("recommendation")
-            if recommendation:
-                lines.append(f"  권장 조치: {recommendation}")
-            lines.append("")
-
-        if not clauses:
-            lines.append("분석된 조항이 없습니다.")
+        clauses = review_result.clauses
+        if clauses:
+            parts.extend(self._format_clause(clause) for clause in clauses)
+        else:
+            parts.append("분석된 조항이 없습니다.")
 
-        return "\n".join(lines)
+        return "\n".join(parts)
 
     @staticmethod
-    def _normalise_text(text: str) -> str:
-        return re.sub(r"\s+", " ", text.strip().lower())
+    def _format_clause(clause: ClauseResult) -> str:
+        """Format one clause result as a pre-joined report block."""
+
+        lines = [
+            "[%s - 위험도: %s]" % (clause.name, _RISK_NAMES[clause.risk_level]),
+            clause.summary,
+        ]
+        if clause.matched_sentences:
+            lines.append("  감지된 문장:")
+            lines.append("\n".join("    - " + sentence for sentence in clause.matched_sentences))
+        if clause.issues:
+            lines.append("  이슈:")
+            lines.append("\n".join("    - " + issue for issue in clause.issues))
+        if clause.notes:
+            lines.append("  참고:")
+            lines.append("\n".join("    - " + note for note in clause.notes))
+        if clause.recommendation:
+            lines.append("  권장 조치: %s" % clause.recommendation)
+        lines.append("")
+        return "\n".join(lines)
 
     @staticmethod
-    def _split_sentences(text: str) -> List[str]:
-        raw_sentences = re.split(r"(?<=[.!?])\s+", text)
-        return [sentence.strip() for sentence in raw_sentences if sentence.strip()]
+    def _review_result_from_dict(review_result: Dict[str, object]) -> ReviewResult:
+        """Rehydrate the legacy dict shape into a :class:`ReviewResult`."""
+
+        return ReviewResult(
+            overall_risk=_RISK_BY_NAME.get(review_result.get("overall_risk"), Risk.LOW),
+            clauses=[
+                ClauseResult(
+                    name=clause.get("name", ""),
+                    present=bool(clause.get("present")),
+                    risk_level=_RISK_BY_NAME.get(clause.get("risk_level"), Risk.LOW),
+                    matched_sentences=clause.get("matched_sentences") or [],
+                    issues=clause.get("issues") or [],
+                    notes=clause.get("notes") or [],
+                    recommendation=clause.get("recommendation", ""),
+                    summary=clause.get("summary", ""),
+                )
+                for clause in review_result.get("clauses", [])
+            ],
+        )
+
+    # A sentence ends only at a terminator followed by whitespace (or at the
+    # end of the text), so decimals and section references like "$1.5" or
+    # "§2.1" do not split mid-sentence.
+    _SENTENCE_RE = re.compile(r".+?(?:(?<=[.!?])\s+|$)", re.DOTALL)
+    _WORD_RE = re.compile(r"\w")
+
+    # Folds A-Z to a-z and maps every ASCII whitespace character to a plain
+    # space in a single C-level pass.
+    _ASCII_FOLD_TABLE = bytes.maketrans(
+        bytes(range(256)),
+        bytes(
+            byte + 32 if 65 <= byte <= 90 else 32 if byte in b"\t\n\r\x0b\x0c" else byte
+            for byte in range(256)
+        ),
+    )
+
+    @classmethod
+    def _iter_sentences(cls, text: str) -> Iterator[str]:
+        """Yield normalised sentences from the raw contract text.
+
+        Splitting, whitespace collapsing and lowercasing happen in one pass
+        over the input, avoiding the intermediate normalised copy of the whole
+        document. ASCII input - the common case for contracts - is case-folded
+        up front with a ``bytes.translate`` lookup table, which is much
+        cheaper than per-sentence ``str.lower``.
+        """
+
+        if text.isascii():
+            text = text.encode("ascii").translate(cls._ASCII_FOLD_TABLE).decode("ascii")
+            for match in cls._SENTENCE_RE.finditer(text):
+                sentence = " ".join(match.group().split())
+                if sentence:
+                    yield sentence
+        else:
+            for match in cls._SENTENCE_RE.finditer(text):
+                sentence = " ".join(match.group().split()).lower()
+                if sentence:
+                    yield sentence
 
     @staticmethod
-    def _build_keyword_pattern(keyword: str) -> Pattern[str]:
-        """Create a regex pattern that matches keyword boundaries safely."""
+    def _keyword_fragment(keyword: str) -> str | None:
+        """Return a regex fragment that matches keyword boundaries safely."""
 
         keyword = keyword.strip().lower()
         if not keyword:
-            return re.compile(r"^$")
+            return None
 
         if re.search(r"\s", keyword):
             parts = [re.escape(part) for part in keyword.split() if part]
-            pattern = r"\b" + r"\s+".join(parts) + r"\b"
-        elif re.search(r"\w", keyword):
-            pattern = r"\b" + re.escape(keyword) + r"\b"
-        else:
-            pattern = re.escape(keyword)
+            return r"\b" + r"\s+".join(parts) + r"\b"
+        if re.search(r"\w", keyword):
+            return r"\b" + re.escape(keyword) + r"\b"
+        return re.escape(keyword)
 
-        return re.compile(pattern)
+    @staticmethod
+    def _compile_literal_re(keywords: Sequence[str]) -> Pattern[str]:
+        """Compile literal keywords into one overlap-safe substring scanner.
+
+        The alternation sits inside a zero-width lookahead with a capturing
+        group, so occurrences that overlap - including keywords contained in
+        other keywords - are all reported, matching per-keyword substring
+        checks. Alternatives are tried longest first; a keyword that is a
+        proper prefix of another can still be shadowed at a shared start and
+        is covered separately via :meth:`_proper_prefix_keywords`.
+        """
+
+        if not keywords:
+            return re.compile(r"(?!)")
+        ordered = sorted(keywords, key=len, reverse=True)
+        return re.compile("(?=(%s))" % "|".join(map(re.escape, ordered)))
 
-    def _evaluate_clause(self, config: ClauseConfig, sentences: Sequence[str]) -> ClauseResult:
-        keyword_patterns = [self._build_keyword_pattern(keyword) for keyword in config.keywords]
-        matched = [
-            sentence
-            for sentence in sentences
-            if any(pattern.search(sentence) for pattern in keyword_patterns)
-        ]
+    @staticmethod
+    def _proper_prefix_keywords(keywords: Sequence[str]) -> Tuple[str, ...]:
+        """Return the keywords that are proper prefixes of another keyword."""
+
+        return tuple(
+            keyword
+            for keyword in keywords
+            if any(other != keyword and other.startswith(keyword) for other in keywords)
+        )
+
+    @staticmethod
+    def _is_word_hit(sentence: str, start: int, end: int) -> bool:
+        """Check that a substring hit sits on word boundaries.
+
+        Mirrors the ``\\b`` anchors of the quick-check pattern by rejecting
+        hits whose neighbouring characters are word characters - alphanumerics
+        or, like ``\\w``, the underscore.
+        """
+
+        if start > 0:
+            neighbour = sentence[start - 1]
+            if neighbour.isalnum() or neighbour == "_":
+                return False
+        if end < len(sentence):
+            neighbour = sentence[end]
+            if neighbour.isalnum() or neighbour == "_":
+                return False
+        return True
+
+    def _scan_with_automaton(self, sentences: Sequence[str]) -> List[ClauseResult]:
+        """Scan the whole document in one automaton pass and bucket by clause.
+
+        The sentences are joined with newlines - a character no phrase can
+        contain - so a single C-level ``automaton.iter`` call covers the full
+        text without the interpreter re-entering per sentence. Hit offsets are
+        mapped back to sentence indices by bisecting the sentence start
+        offsets.
+        """
+
+        keyword_hits: List[Set[int]] = [set() for _ in self._clauses]
+        warning_hits: List[Dict[int, Set[str]]] = [{} for _ in self._clauses]
+        positive_hits: List[Dict[int, Set[str]]] = [{} for _ in self._clauses]
+
+        document = "\n".join(sentences)
+        if not self._first_chars.isdisjoint(document):
+            sentence_starts = []
+            offset = 0
+            for sentence in sentences:
+                sentence_starts.append(offset)
+                offset += len(sentence) + 1
+            for end, (phrase, needs_boundary, owners) in self._automaton.iter(document):
+                start = end - len(phrase) + 1
+                sentence_idx = bisect_right(sentence_starts, start) - 1
+                for clause_idx, kind, keyword in owners:
+                    if kind == "keyword":
+                        if not needs_boundary or self._is_word_hit(document, start, end + 1):
+                            keyword_hits[clause_idx].add(sentence_idx)
+                    elif kind == "warning":
+                        warning_hits[clause_idx].setdefault(sentence_idx, set()).add(keyword)
+                    else:
+                        positive_hits[clause_idx].setdefault(sentence_idx, set()).add(keyword)
+
+        results: List[ClauseResult] = []
+        for clause_idx, config in enumerate(self._clauses):
+            matched_idx = sorted(keyword_hits[clause_idx])
+            matched = [sentences[i] for i in matched_idx]
+            warnings: List[str] = []
+            positives: List[str] = []
+            severe = False
+            clause_warnings = warning_hits[clause_idx]
+            clause_positives = positive_hits[clause_idx]
+            warning_keywords = config.warning_keywords
+            positive_keywords = config.positive_keywords
+            if not (warning_keywords or positive_keywords):
+                matched_idx = ()
+            for sentence_idx in matched_idx:
+                sentence_warning_hits = clause_warnings.get(sentence_idx, ())
+                for warning_keyword in warning_keywords:
+                    if warning_keyword in sentence_warning_hits:
+                        severe = severe or "심각" in warning_keyword
+                        warnings.append(
+                            f"주의: '{warning_keyword}' 표현이 포함되어 있어 위험이 증가할 수 있습니다."
+                        )
+                sentence_positive_hits = clause_positives.get(sentence_idx, ())
+                positive_matches = [
+                    kw for kw in positive_keywords if kw in sentence_positive_hits
+                ]
+                if positive_matches:
+                    positives.append(
+                        "".join((_POSITIVE_PREFIX, ", ".join(positive_matches), _POSITIVE_SUFFIX))
+                    )
+            results.append(
+                self._build_clause_result(config, matched, warnings, positives, severe)
+            )
+        return results
+
+    @classmethod
+    def _has_keyword(cls, sentence: str, keyword: str) -> bool:
+        """Check for a word-boundary occurrence of a literal keyword.
+
+        ``str.find`` runs at C speed, which beats regex dispatch for the
+        short literal keywords used here; boundaries are enforced the same
+        way as in the automaton path.
+        """
+
+        pos = sentence.find(keyword)
+        while pos != -1:
+            if cls._is_word_hit(sentence, pos, pos + len(keyword)):
+                return True
+            pos = sentence.find(keyword, pos + 1)
+        return False
+
+    def _scan_fallback(self, contract_text: str, sentences: Sequence[str]) -> List[ClauseResult]:
+        """Match clause keywords against sentences and bucket by clause.
+
+        The document-level quick check narrows the work to clauses with at
+        least one hit; those are then matched per sentence by the generated
+        scanner from :meth:`_build_scan_all`.
+        """
+
+        candidates = {
+            clause_idx
+            for clause_idx, candidate_re in enumerate(self._candidate_res)
+            if candidate_re.search(contract_text)
+        }
+        if candidates:
+            matched = self._scan_all(sentences, candidates)
+        else:
+            matched = [[] for _ in self._compiled]
+
+        results: List[ClauseResult] = []
+        for compiled, matched_sentences in zip(self._compiled, matched):
+            warnings, positives, severe = (
+                self._evaluate_warnings(compiled, matched_sentences)
+                if matched_sentences and (compiled.has_warnings or compiled.has_positives)
+                else ([], [], False)
+            )
+            results.append(
+                self._build_clause_result(
+                    compiled.config, matched_sentences, warnings, positives, severe
+                )
+            )
+        return results
+
+    @staticmethod
+    def _build_clause_result(
+        config: ClauseConfig,
+        matched: List[str],
+        warnings: List[str],
+        positives: List[str],
+        severe: bool = False,
+    ) -> ClauseResult:
         issues: List[str] = []
         notes: List[str] = []
-        risk = "low" if matched else config.missing_risk
+        risk = Risk.LOW if matched else _RISK_BY_NAME.get(config.missing_risk, Risk.LOW)
 
         if matched:
-            warnings, positives = self._evaluate_warnings(config, matched)
             issues.extend(warnings)
             notes.extend(positives)
-            if warnings and risk != "high":
-                risk = "medium" if risk == "low" else risk
-                if any('심각' in warning for warning in warnings):
-                    risk = "high"
+            if warnings:
+                risk = Risk.HIGH if severe else Risk.MEDIUM
 
         recommendation = config.recommendation
 
@@ -261,30 +697,62 @@ class ContractReviewService:
             summary=config.summary,
         )
 
-    def _evaluate_warnings(self, config: ClauseConfig, sentences: Sequence[str]) -> Tuple[List[str], List[str]]:
+    def _evaluate_warnings(
+        self, compiled: _CompiledClause, sentences: Sequence[str]
+    ) -> Tuple[List[str], List[str], bool]:
+        config = compiled.config
+        has_warnings = compiled.has_warnings
+        has_positives = compiled.has_positives
+        warning_finditer = compiled.warning_re.finditer
+        positive_finditer = compiled.positive_re.finditer
+        warning_prefixes = compiled.warning_prefixes
+        positive_prefixes = compiled.positive_prefixes
+        warning_keywords = config.warning_keywords
+        positive_keywords = config.positive_keywords
         warnings: List[str] = []
         positives: List[str] = []
+        severe = False
         for sentence in sentences:
-            for warning_keyword in config.warning_keywords:
-                if warning_keyword in sentence:
-                    warnings.append(
-                        f"주의: '{warning_keyword}' 표현이 포함되어 있어 위험이 증가할 수 있습니다."
+            if has_warnings:
+                warning_hits = {match.group(1) for match in warning_finditer(sentence)}
+                for prefix_keyword in warning_prefixes:
+                    if prefix_keyword in sentence:
+                        warning_hits.add(prefix_keyword)
+                for warning_keyword in warning_keywords:
+                    if warning_keyword in warning_hits:
+                        severe = severe or "심각" in warning_keyword
+                        warnings.append(
+                            f"주의: '{warning_keyword}' 표현이 포함되어 있어 위험이 증가할 수 있습니다."
+                        )
+            if has_positives:
+                positive_hits = {match.group(1) for match in positive_finditer(sentence)}
+                for prefix_keyword in positive_prefixes:
+                    if prefix_keyword in sentence:
+                        positive_hits.add(prefix_keyword)
+                positive_matches = [kw for kw in positive_keywords if kw in positive_hits]
+                if positive_matches:
+                    positives.append(
+                        "".join((_POSITIVE_PREFIX, ", ".join(positive_matches), _POSITIVE_SUFFIX))
                     )
-            positive_hits = [kw for kw in config.positive_keywords if kw in sentence]
-            if positive_hits:
-                positives.append(
-                    "양호: " + ", ".join(positive_hits) + " 표현이 있어 조건이 개선됩니다."
-                )
-        return warnings, positives
+        return warnings, positives, severe
 
     @staticmethod
-    def _calculate_overall_risk(results: Sequence[ClauseResult]) -> str:
-        risk_levels = {"low": 0, "medium": 1, "high": 2}
-        max_score = max((risk_levels.get(result.risk_level, 0) for result in results), default=0)
-        for level, score in risk_levels.items():
-            if score == max_score:
-                return level
-        return "low"
+    def _calculate_overall_risk(results: Sequence[ClauseResult]) -> Risk:
+        return max((result.risk_level for result in results), default=Risk.LOW)
+
+
+_WORKER_SERVICE: ContractReviewService | None = None
+
+
+def _init_worker(clause_configs: Sequence[ClauseConfig]) -> None:
+    """Build one service per worker process for :meth:`review_many`."""
+
+    global _WORKER_SERVICE
+    _WORKER_SERVICE = ContractReviewService(clause_configs)
+
+
+def _worker_review(contract_text: str) -> ReviewResult:
+    return _WORKER_SERVICE.review(contract_text)
 
 
 def _main() -> None:
@@ -310,7 +778,7 @@ def _main() -> None:
     review = service.review(contract_text)
 
     if args.format == "json":
-        print(json.dumps(review, ensure_ascii=False, indent=2))
+        print(json.dumps(review.to_json_dict(), ensure_ascii=False, indent=2))
     else:
         print(service.generate_report(review))
 
@@ -3,7 +3,8 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from contract_review_service import ContractReviewService
+import contract_review_service
+from contract_review_service import ClauseConfig, ContractReviewService, Risk
 
 
 def test_detects_missing_termination_clause():
@@ -14,13 +15,13 @@ def test_detects_missing_termination_clause():
     )
 
     review = service.review(contract_text)
-    clauses = {clause["name"]: clause for clause in review["clauses"]}
+    clauses = {clause.name: clause for clause in review.clauses}
 
     termination = clauses["Termination"]
-    assert termination["present"] is False
-    assert termination["risk_level"] == "high"
-    assert any("감지되지 않았습니다" in issue for issue in termination["issues"])
-    assert review["overall_risk"] == "high"
+    assert termination.present is False
+    assert termination.risk_level is Risk.HIGH
+    assert any("감지되지 않았습니다" in issue for issue in termination.issues)
+    assert review.overall_risk is Risk.HIGH
 
 
 def test_positive_notes_lower_risk_when_clauses_are_balanced():
@@ -32,18 +33,187 @@ def test_positive_notes_lower_risk_when_clauses_are_balanced():
     )
 
     review = service.review(contract_text)
-    clauses = {clause["name"]: clause for clause in review["clauses"]}
+    clauses = {clause.name: clause for clause in review.clauses}
 
     termination = clauses["Termination"]
-    assert termination["present"] is True
-    assert termination["risk_level"] == "low"
-    assert any(note.startswith("양호") for note in termination["notes"])
+    assert termination.present is True
+    assert termination.risk_level is Risk.LOW
+    assert any(note.startswith("양호") for note in termination.notes)
 
     liability = clauses["Liability"]
-    assert liability["risk_level"] == "low"
-    assert any(note.startswith("양호") for note in liability["notes"])
+    assert liability.risk_level is Risk.LOW
+    assert any(note.startswith("양호") for note in liability.notes)
 
-    assert review["overall_risk"] == "medium"
+    assert review.overall_risk is Risk.MEDIUM
+
+
+def test_automaton_and_fallback_paths_agree(monkeypatch):
+    contract_text = (
+        "Either party may terminate this agreement upon thirty days written notice. "
+        "The Supplier shall maintain confidentiality of all proprietary data. "
+        "Liability is unlimited for any damages arising from late fee penalties."
+    )
+
+    fast_review = ContractReviewService().review(contract_text)
+
+    monkeypatch.setattr(contract_review_service, "ahocorasick", None)
+    slow_review = ContractReviewService().review(contract_text)
+
+    assert fast_review == slow_review
+
+
+def test_underscore_neighbours_do_not_count_as_word_boundaries(monkeypatch):
+    contract_text = "The foo_terminate flag and the liability_ column are internal names."
+
+    fast_review = ContractReviewService().review(contract_text)
+
+    monkeypatch.setattr(contract_review_service, "ahocorasick", None)
+    slow_review = ContractReviewService().review(contract_text)
+
+    assert fast_review == slow_review
+    clauses = {clause.name: clause for clause in fast_review.clauses}
+    assert clauses["Termination"].present is False
+    assert clauses["Liability"].present is False
+
+
+def test_decimal_amounts_do_not_split_sentences():
+    service = ContractReviewService()
+    contract_text = "The total fee is $1.5 million payable upon invoice."
+
+    review = service.review(contract_text)
+    clauses = {clause.name: clause for clause in review.clauses}
+
+    assert clauses["Payment Terms"].matched_sentences == [
+        "the total fee is $1.5 million payable upon invoice."
+    ]
+
+
+def test_symbol_only_keywords_match_without_word_boundaries(monkeypatch):
+    configs = [
+        ClauseConfig(
+            name="References",
+            keywords=("§",),
+            missing_risk="low",
+            summary="조항 인용 방식을 확인합니다.",
+            recommendation="인용하는 조항 번호를 명확히 하세요.",
+        ),
+    ]
+    contract_text = "Fees are described in §5 of this agreement."
+
+    fast_review = ContractReviewService(configs).review(contract_text)
+
+    monkeypatch.setattr(contract_review_service, "ahocorasick", None)
+    slow_review = ContractReviewService(configs).review(contract_text)
+
+    assert fast_review == slow_review
+    assert fast_review.clauses[0].present is True
+
+
+def test_clauses_sharing_keywords_are_both_detected(monkeypatch):
+    configs = [
+        ClauseConfig(
+            name="Termination",
+            keywords=("written notice",),
+            missing_risk="high",
+            summary="Termination 권한과 조건을 확인합니다.",
+            recommendation="상호 합리적인 통지 기간과 사유를 명시하세요.",
+        ),
+        ClauseConfig(
+            name="Notices",
+            keywords=("notice",),
+            missing_risk="medium",
+            summary="통지 방식과 기한을 확인합니다.",
+            recommendation="통지 수단과 도달 시점을 명시하세요.",
+        ),
+    ]
+    contract_text = "Party must give written notice."
+
+    fast_review = ContractReviewService(configs).review(contract_text)
+
+    monkeypatch.setattr(contract_review_service, "ahocorasick", None)
+    slow_review = ContractReviewService(configs).review(contract_text)
+
+    assert fast_review == slow_review
+    clauses = {clause.name: clause for clause in fast_review.clauses}
+    assert clauses["Termination"].present is True
+    assert clauses["Notices"].present is True
+
+
+def test_overlapping_warning_keywords_are_all_reported(monkeypatch):
+    configs = [
+        ClauseConfig(
+            name="Liability",
+            keywords=("liability",),
+            missing_risk="high",
+            summary="책임 및 손해배상 한도를 확인합니다.",
+            recommendation="손해배상 한도와 면책 범위를 명확히 정의하세요.",
+            warning_keywords=("unlimited", "limited", "limit"),
+        ),
+    ]
+    contract_text = "Liability under this agreement is unlimited."
+
+    fast_review = ContractReviewService(configs).review(contract_text)
+
+    monkeypatch.setattr(contract_review_service, "ahocorasick", None)
+    slow_review = ContractReviewService(configs).review(contract_text)
+
+    assert fast_review == slow_review
+    issues = fast_review.clauses[0].issues
+    for keyword in ("unlimited", "limited", "limit"):
+        assert any(f"'{keyword}'" in issue for issue in issues)
+
+
+def test_mixed_case_warning_keywords_behave_the_same_on_both_paths(monkeypatch):
+    configs = [
+        ClauseConfig(
+            name="Termination",
+            keywords=("terminate",),
+            missing_risk="high",
+            summary="Termination 권한과 조건을 확인합니다.",
+            recommendation="상호 합리적인 통지 기간과 사유를 명시하세요.",
+            warning_keywords=("Sole Discretion", "immediate"),
+            positive_keywords=("Written Notice", "mutual"),
+        ),
+    ]
+    contract_text = (
+        "Either party may terminate immediately at its sole discretion "
+        "upon mutual written notice."
+    )
+
+    fast_review = ContractReviewService(configs).review(contract_text)
+
+    monkeypatch.setattr(contract_review_service, "ahocorasick", None)
+    slow_review = ContractReviewService(configs).review(contract_text)
+
+    assert fast_review == slow_review
+    termination = fast_review.clauses[0]
+    assert any("'immediate'" in issue for issue in termination.issues)
+    assert not any("Sole Discretion" in issue for issue in termination.issues)
+    assert any("mutual" in note for note in termination.notes)
+    assert not any("Written Notice" in note for note in termination.notes)
+
+
+def test_review_many_matches_individual_reviews():
+    service = ContractReviewService()
+    contract_texts = [
+        "Either party may terminate this agreement upon thirty days written notice.",
+        "Confidential information shared under this agreement remains proprietary.",
+        "Fees are payable within thirty days of invoice.",
+    ]
+
+    batch = service.review_many(contract_texts, workers=2)
+
+    assert batch == [service.review(text) for text in contract_texts]
+
+
+def test_repeated_review_of_identical_text_is_cached():
+    service = ContractReviewService()
+    contract_text = "Either party may terminate this agreement upon thirty days written notice."
+
+    first = service.review(contract_text)
+    second = service.review(contract_text)
+
+    assert second is first
 
 
 def test_substring_words_do_not_trigger_clause_detection():
@@ -55,12 +225,12 @@ def test_substring_words_do_not_trigger_clause_detection():
     )
 
     review = service.review(contract_text)
-    clauses = {clause["name"]: clause for clause in review["clauses"]}
+    clauses = {clause.name: clause for clause in review.clauses}
 
     confidentiality = clauses["Confidentiality"]
-    assert confidentiality["present"] is False
-    assert confidentiality["matched_sentences"] == []
+    assert confidentiality.present is False
+    assert confidentiality.matched_sentences == []
 
     intellectual_property = clauses["Intellectual Property"]
-    assert intellectual_property["present"] is False
-    assert intellectual_property["matched_sentences"] == []
+    assert intellectual_property.present is False
+    assert intellectual_property.matched_sentences == []